@@ -0,0 +1,33 @@
+"""
+OCR text cleanup, kept free of other dependencies so it can optionally be
+compiled to a C extension with mypyc (see README).
+"""
+import re
+from typing import Dict, Final, Optional
+
+# Characters that are neither word characters nor whitespace
+_RE_PUNCT: Final = re.compile(r'[^\w\s]')
+
+# str.translate table deleting the ASCII characters _RE_PUNCT matches
+_PUNCT_TABLE: Final[Dict[int, Optional[int]]] = dict.fromkeys(
+    i for i in range(128) if _RE_PUNCT.match(chr(i))
+)
+
+
+def clean_ocr_text(text: str) -> str:
+    """
+    Normalize raw OCR output: lowercase, strip punctuation and collapse
+    whitespace. Returns an empty string if no words remain.
+    """
+    # Convert to lowercase
+    text = text.lower()
+    
+    # Remove special characters except spaces, with a single C-level
+    # translate pass for the common all-ASCII case
+    if text.isascii():
+        text = text.translate(_PUNCT_TABLE)
+    else:
+        text = _RE_PUNCT.sub('', text)
+    
+    # Collapse whitespace runs into single spaces and trim the ends
+    return " ".join(text.split())
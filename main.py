@@ -1,18 +1,47 @@
 import re
 import os
-from typing import List, Dict, Any, Optional
-from urllib.parse import urljoin
+import io
+import json
+import hashlib
+import sqlite3
+import threading
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import asynccontextmanager
+from typing import List, Dict, Any, Optional, Callable, Awaitable, Set
+from urllib.parse import urljoin, urlparse
 import datetime
 import logging
 import time
+import traceback
+from logging.handlers import RotatingFileHandler
 
-import requests
-from bs4 import BeautifulSoup
+import httpx
+import pytesseract
+from cachetools import TTLCache
+from PIL import Image
+from selectolax.lexbor import LexborHTMLParser as HTMLParser
 from fastapi import FastAPI, HTTPException
-from pydantic import BaseModel
-from playwright.async_api import async_playwright, TimeoutError, Error
+from pydantic import BaseModel, Field
+from playwright.async_api import (
+    async_playwright, Browser, BrowserContext, TimeoutError, Error
+)
+
+from _cleanup import clean_ocr_text
 
 
+# Optional in-process Tesseract bindings, used over pytesseract if installed
+try:
+    import tesserocr
+except ImportError:
+    tesserocr = None
+
+# File locking for the shared video count table (POSIX only)
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
 # Load environment variables
 try:
     from dotenv import load_dotenv
@@ -25,7 +54,9 @@ logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
     handlers=[
-        logging.FileHandler("scraper.log"),
+        RotatingFileHandler(
+            "scraper.log", maxBytes=10 * 1024 * 1024, backupCount=5
+        ),
         logging.StreamHandler()
     ]
 )
@@ -39,11 +70,476 @@ USER_AGENT = (
     "Chrome/122.0.0.0 Safari/537.36"
 )
 
+# Internal RPC behind the site's search box, used to skip the browser
+SEARCH_SUGGESTIONS_URL = (
+    "https://adstransparency.google.com/anji/_/rpc/SearchService/SearchSuggestions"
+)
+
+# Connection pool limits for the shared HTTP client
+HTTP_MAX_CONNECTIONS = int(os.environ.get('HTTP_MAX_CONNECTIONS', 100))
+HTTP_MAX_KEEPALIVE_CONNECTIONS = int(
+    os.environ.get('HTTP_MAX_KEEPALIVE_CONNECTIONS', 20)
+)
+
+# Image filters applied before OCR
+SKIPPED_IMAGE_EXTENSIONS = ('.svg', '.ico', '.gif')
+MIN_IMAGE_SIZE = 64
+MAX_IMAGE_BYTES = 5_000_000
+
+# Save debug screenshots while scraping (slow, off by default)
+DEBUG_SCREENSHOTS = os.environ.get('DEBUG_SCREENSHOTS', '0') == '1'
+
+# How long a video page gets to show any video indicator (milliseconds)
+VIDEO_SELECTOR_TIMEOUT = int(os.environ.get('VIDEO_SELECTOR_TIMEOUT', 5000))
+
+# Interval between video counts while waiting for them to settle (milliseconds)
+VIDEO_SETTLE_INTERVAL = int(os.environ.get('VIDEO_SETTLE_INTERVAL', 500))
+
+# Resource types that never affect what we scrape, aborted to speed up loads
+BLOCKED_RESOURCE_TYPES = {"image", "media", "font", "stylesheet"}
+
+# Configure the browser context pool
+POOL_SIZE = int(os.environ.get('POOL_SIZE', 4))
+MAX_USES_PER_INSTANCE = int(os.environ.get('MAX_USES_PER_INSTANCE', 50))
+
+# Worker processes for CPU-bound OCR, created on startup
+OCR_WORKERS = int(os.environ.get('OCR_WORKERS', 0)) or os.cpu_count()
+OCR_POOL: Optional[ProcessPoolExecutor] = None
+
+# Per-process tesserocr API, set up by init_ocr_worker in each OCR worker
+_TESS_API = None
+
+# Persistent cache of OCR text per image URL, opened on startup
+OCR_CACHE_FILE = os.environ.get('OCR_CACHE_FILE', '/tmp/ads_ocr_cache.sqlite3')
+OCR_CACHE_SIZE_LIMIT = int(os.environ.get('OCR_CACHE_SIZE_LIMIT', 2**30))
+OCR_CACHE: Optional["OCRCache"] = None
+
+# Hard-coded known IDs for specific advertisers
+# This ensures we get the correct IDs that have videos
+KNOWN_ADVERTISER_IDS = {
+    "adidas": "AR14017378248766259201"
+}
+
+# Advertiser ID patterns, compiled once at import
+_AR_URL_RE = re.compile(
+    r'advertiser/(?P<path>[A-Z0-9]+)|(?P<bare>AR\d+)|[?&]id=(?P<query>[A-Z0-9]+)'
+)
+_AR_BARE_RE = re.compile(r'AR\d+')
+
+# Finds an advertiser ID on the current page in one DOM pass: the URL first,
+# then ID-carrying attributes, then the visible page text
+_ADVERTISER_ID_JS = r'''() => {
+    let match = document.URL.match(/AR\d+/);
+    if (match) {
+        return {id: match[0], source: "URL"};
+    }
+    
+    const elements = document.querySelectorAll(
+        '[data-advertiser-id], [data-id], [id*="advertiser"]'
+    );
+    for (const el of elements) {
+        const advertiserId = el.getAttribute('data-advertiser-id');
+        if (advertiserId) {
+            return {id: advertiserId, source: "attributes"};
+        }
+        match = (el.getAttribute('data-id') || el.id || '').match(/AR\d+/);
+        if (match) {
+            return {id: match[0], source: "attributes"};
+        }
+    }
+    
+    match = document.body.innerText.match(/AR\d+/);
+    if (match) {
+        return {id: match[0], source: "text"};
+    }
+    
+    return null;
+}'''
+
+# Video indicators counted on an advertiser's video page, in priority order
+_VIDEO_SELECTORS = [
+    'video',                           # Direct video elements
+    'iframe[src*="youtube"]',          # YouTube embeds
+    'iframe[src*="vimeo"]',            # Vimeo embeds
+    'div[role="region"][aria-label*="carousel"]', # Carousels that might contain videos
+    '.video-container',                # Common video container class
+    'div[class*="video"]',             # Elements with "video" in class name
+    'div[id*="video"]',                # Elements with "video" in id
+    'div[class*="carousel"]',          # Carousel elements that might contain videos
+    'div[class*="slider"]',            # Slider elements that might contain videos
+]
+
+# Empty-state containers shown on a video page with no videos
+_EMPTY_STATE_SELECTOR = '[class*="no-results"], [data-testid*="empty"]'
+
+# Counts the videos on an advertiser's video page: the first of the given
+# selectors that matches anything wins
+_VIDEO_COUNT_JS = '''(selectors) => {
+    // Walk the DOM once for all selectors, then return the count
+    // for the first selector in the list that matched anything
+    const counts = selectors.map(() => 0);
+    for (const el of document.querySelectorAll(selectors.join(', '))) {
+        selectors.forEach((selector, i) => {
+            if (el.matches(selector)) {
+                counts[i]++;
+            }
+        });
+    }
+    return counts.find(c => c > 0) || 0;
+}'''
+
+# Checks the page text for a "no videos" message in a single regex pass.
+# Reading innerText forces a layout, so this is only a last resort.
+_NO_VIDEOS_TEXT_JS = r'''() => {
+    const noVideoRe = /no (?:video ads|videos|ads found|results|ads to show)/i;
+    return noVideoRe.test(document.body.innerText);
+}'''
+
+# Returns the outerHTML of the most likely search input on the page,
+# trying selectors from most to least specific and then any input at all
+_SEARCH_INPUT_JS = '''() => {
+    const selectors = [
+        'input[class*="search"]',
+        'input[class*="query"]',
+        'input.input-area',
+        'input[type="search"]',
+        'input[placeholder*="search" i]',
+        'input[placeholder*="find" i]',
+        'input[aria-label*="search" i]',
+        'input[role="search"]',
+        'input[role="searchbox"]',
+        '[role="search"] input',
+        '[role="searchbox"] input',
+        '[role="combobox"] input',
+        'input'
+    ];
+    
+    for (const selector of selectors) {
+        const element = document.querySelector(selector);
+        if (element) {
+            return element.outerHTML;
+        }
+    }
+    
+    return "";
+}'''
+
+# In-process caches of successful lookups. Reads and writes never await,
+# so they are atomic on the event loop and need no lock. Video counts
+# change more often than advertiser IDs, so they expire sooner.
+CACHE_TTL = int(os.environ.get('CACHE_TTL', 86400))
+VIDEO_CACHE_TTL = int(os.environ.get('VIDEO_CACHE_TTL', 3600))
+CACHE_MAXSIZE = int(os.environ.get('CACHE_MAXSIZE', 10000))
+_advertiser_id_cache = TTLCache(maxsize=CACHE_MAXSIZE, ttl=CACHE_TTL)
+_video_cache = TTLCache(maxsize=CACHE_MAXSIZE, ttl=VIDEO_CACHE_TTL)
+
+# Read-only seed of advertiser ID -> video count for IDs whose pages are
+# problematic to load. Tracked in the repo; these counts never expire.
+KNOWN_VIDEO_COUNTS_SEED_FILE = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), 'known_video_counts.json'
+)
+
+# Writable table of browser-checked video counts and when they were
+# checked, shared across restarts and workers. Entries older than
+# VIDEO_CACHE_TTL are ignored.
+KNOWN_VIDEO_COUNTS_FILE = os.environ.get(
+    'KNOWN_VIDEO_COUNTS_FILE', '/tmp/ads_known_video_counts.json'
+)
+
+# Only answer video checks from the lookup tables, never from a browser
+ADS_LUT_ONLY = os.environ.get('ADS_LUT_ONLY', '0') == '1'
+
+
+def load_known_video_counts(path: str) -> Dict[str, Any]:
+    """Load a video count lookup table, or an empty one if unreadable."""
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        logging.warning(f"Could not load known video counts from {path}: {str(e)}")
+        return {}
+
+
+def save_known_video_count(advertiser_id: str, video_count: int):
+    """
+    Add a checked video count to the writable table. Other workers write
+    the same file, so it is re-read and merged under a lock, dropping
+    expired entries, then replaced atomically so a crash mid-write never
+    leaves a truncated file behind. Blocks on the lock and disk I/O, so
+    async code calls it through asyncio.to_thread.
+    """
+    global _checked_video_counts
+    try:
+        with _video_counts_lock, open(f"{KNOWN_VIDEO_COUNTS_FILE}.lock", 'w') as lock:
+            if fcntl:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+            now = time.time()
+            stored = load_known_video_counts(KNOWN_VIDEO_COUNTS_FILE)
+            counts = {
+                checked_id: entry for checked_id, entry in stored.items()
+                if isinstance(entry, dict)
+                and now - entry["checked_at"] < VIDEO_CACHE_TTL
+            }
+            counts[advertiser_id] = {
+                "video_count": video_count,
+                "checked_at": now
+            }
+            tmp_path = f"{KNOWN_VIDEO_COUNTS_FILE}.{os.getpid()}.tmp"
+            with open(tmp_path, 'w') as f:
+                json.dump(counts, f, indent=2, sort_keys=True)
+            os.replace(tmp_path, KNOWN_VIDEO_COUNTS_FILE)
+        _checked_video_counts = counts
+    except OSError as e:
+        logging.warning(f"Could not save known video counts: {str(e)}")
+
+
+async def record_video_count(advertiser_id: str, video_count: int):
+    """Cache a browser-checked video count in memory and on disk."""
+    _video_cache[advertiser_id] = (video_count > 0, video_count)
+    await asyncio.to_thread(save_known_video_count, advertiser_id, video_count)
+
+
+# Serializes saves from this process's threads, which flock alone does
+# not do where fcntl is unavailable
+_video_counts_lock = threading.Lock()
+
+_KNOWN_VIDEO_COUNTS = load_known_video_counts(KNOWN_VIDEO_COUNTS_SEED_FILE)
+_checked_video_counts = load_known_video_counts(KNOWN_VIDEO_COUNTS_FILE)
+
+# Scrapes currently running, keyed by lowercased advertiser name
+_inflight: Dict[str, asyncio.Task] = {}
+
+# Video checks currently running, keyed by advertiser ID
+_video_inflight: Dict[str, asyncio.Task] = {}
+
+# How long single video checks wait to be batched with others (seconds)
+VIDEO_BATCH_WINDOW = float(os.environ.get('VIDEO_BATCH_WINDOW', 0.05))
+
+# Most advertiser names accepted by one /scrape_batch request
+MAX_BATCH_SIZE = int(os.environ.get('MAX_BATCH_SIZE', 20))
+
+# Most video pages open at once in one batch's browser context
+MAX_VIDEO_TABS = int(os.environ.get('MAX_VIDEO_TABS', 4))
+
+# Guards the lazy launch of the shared browser
+_browser_lock = asyncio.Lock()
+
+# Limits browser contexts opened outside the pool, which is bounded already
+MAX_PARALLEL_BROWSERS = int(os.environ.get('MAX_PARALLEL_BROWSERS', 4))
+_BROWSER_SEM = asyncio.Semaphore(MAX_PARALLEL_BROWSERS)
+
+
+async def block_heavy_resources(route):
+    """
+    Abort requests for images, media, fonts and stylesheets.
+    """
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+class ContextPool:
+    """
+    Bounded pool of pre-warmed browser contexts shared across requests.
+
+    Requests wait on the queue when every context is busy. A context is
+    recycled after MAX_USES_PER_INSTANCE uses, or as soon as a request
+    using it fails, to keep Chromium memory from growing unbounded.
+    """
+
+    def __init__(self, browser: Browser, size: int, max_uses: int):
+        self.browser = browser
+        self.size = size
+        self.max_uses = max_uses
+        # A None slot is created lazily on the next acquire
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=size)
+        self._uses: Dict[BrowserContext, int] = {}
+
+    async def start(self):
+        """Fill the pool with fresh contexts."""
+        for _ in range(self.size):
+            self._queue.put_nowait(await self._new_context())
+
+    async def close(self):
+        """Close every idle context in the pool."""
+        while not self._queue.empty():
+            context = self._queue.get_nowait()
+            if context:
+                await self._retire(context)
+
+    async def _new_context(self) -> BrowserContext:
+        # Create a context with longer timeout and realistic viewport
+        context = await self.browser.new_context(
+            viewport={"width": 1280, "height": 720},
+            user_agent=USER_AGENT
+        )
+        
+        # Set longer default timeout (90 seconds)
+        context.set_default_timeout(90000)
+        
+        # Skip downloading heavy resources the search flow never reads
+        await context.route("**/*", block_heavy_resources)
+        
+        self._uses[context] = 0
+        return context
+
+    async def _retire(self, context: BrowserContext):
+        self._uses.pop(context, None)
+        try:
+            await context.close()
+        except Error as e:
+            logging.warning(f"Error closing browser context: {str(e)}")
+
+    @asynccontextmanager
+    async def acquire(self):
+        """Borrow a context from the pool, waiting if none is free."""
+        context = await self._queue.get()
+        failed = False
+        try:
+            if context is None:
+                context = await self._new_context()
+            yield context
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            if context is not None:
+                self._uses[context] += 1
+                if failed or self._uses[context] >= self.max_uses:
+                    await self._retire(context)
+                    context = None
+            self._queue.put_nowait(context)
+
+
+class OCRCache:
+    """
+    SQLite-backed cache of cleaned OCR text keyed by a hash of the image URL.
+    Once the stored text exceeds size_limit bytes, the least frequently
+    used entries are evicted first, so popular ads stay cached. Methods
+    block on disk I/O, so async code calls them through asyncio.to_thread.
+    The file may be shared by several workers; any database error is
+    logged and treated as a miss or a skipped store.
+    """
+
+    def __init__(self, path: str, size_limit: int):
+        self.size_limit = size_limit
+        
+        # Calls run in worker threads via asyncio.to_thread, so the
+        # connection is shared across threads and guarded by a lock
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS ocr_texts ("
+            "key TEXT PRIMARY KEY, size INTEGER NOT NULL, "
+            "hits INTEGER NOT NULL DEFAULT 0, text TEXT NOT NULL)"
+        )
+        self._db.execute(
+            "CREATE INDEX IF NOT EXISTS ocr_texts_hits ON ocr_texts (hits)"
+        )
+        self._db.commit()
+
+    @staticmethod
+    def _key(url: str) -> str:
+        return hashlib.blake2b(url.encode(), digest_size=16).hexdigest()
+
+    def get_many(self, urls: List[str]) -> Dict[str, str]:
+        """
+        Return the cached text for each url that hits, counting one use
+        per hit. All hit counts are updated in a single commit.
+        """
+        keys = {self._key(url): url for url in urls}
+        key_list = list(keys)
+        rows = []
+        with self._lock:
+            try:
+                # Stay under SQLite's limit on bound parameters per statement
+                for start in range(0, len(key_list), 500):
+                    chunk = key_list[start:start + 500]
+                    rows += self._db.execute(
+                        "SELECT key, text FROM ocr_texts WHERE key IN "
+                        f"({', '.join('?' * len(chunk))})",
+                        chunk
+                    ).fetchall()
+                if rows:
+                    self._db.executemany(
+                        "UPDATE ocr_texts SET hits = hits + 1 WHERE key = ?",
+                        [(key,) for key, _ in rows]
+                    )
+                    self._db.commit()
+            except sqlite3.Error as e:
+                logging.warning(f"OCR cache lookup failed: {str(e)}")
+                self._rollback()
+                return {}
+        return {keys[key]: text for key, text in rows}
+
+    def set_many(self, texts: Dict[str, str]):
+        """
+        Store the cleaned text for each url in a single commit, evicting
+        entries if over the limit.
+        """
+        with self._lock:
+            try:
+                self._db.executemany(
+                    "INSERT INTO ocr_texts (key, size, text) VALUES (?, ?, ?) "
+                    "ON CONFLICT(key) DO UPDATE SET "
+                    "size = excluded.size, text = excluded.text",
+                    [
+                        (self._key(url), len(text.encode()), text)
+                        for url, text in texts.items()
+                    ]
+                )
+                self._evict()
+                self._db.commit()
+            except sqlite3.Error as e:
+                logging.warning(f"OCR cache store failed: {str(e)}")
+                self._rollback()
+
+    def _evict(self):
+        # Sum sizes in the database, which other workers also write to
+        total = self._db.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM ocr_texts"
+        ).fetchone()[0]
+        evicted = 0
+        while total > self.size_limit:
+            # Least used first, a batch at a time to keep memory flat
+            rows = self._db.execute(
+                "SELECT key, size FROM ocr_texts ORDER BY hits, rowid LIMIT 100"
+            ).fetchall()
+            if not rows:
+                break
+            batch = []
+            for key, size in rows:
+                if total <= self.size_limit:
+                    break
+                batch.append((key,))
+                total -= size
+            self._db.executemany("DELETE FROM ocr_texts WHERE key = ?", batch)
+            evicted += len(batch)
+        if evicted:
+            logging.info(f"Evicted {evicted} entries from the OCR cache")
+
+    def _rollback(self):
+        try:
+            self._db.rollback()
+        except sqlite3.Error:
+            pass
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
 
 class AdvertiserRequest(BaseModel):
     advertiser_name: str
 
 
+class BatchAdvertiserRequest(BaseModel):
+    advertiser_names: List[str] = Field(max_length=MAX_BATCH_SIZE)
+
+
 class ScrapingResponse(BaseModel):
     page_content: List[str]
     search_input: str
@@ -71,6 +567,88 @@ class PingResponse(BaseModel):
 app = FastAPI(title="Google Ads Transparency Scraper")
 
 
+@app.on_event("startup")
+async def startup_event():
+    """
+    Launch the shared Playwright browser and HTTP client reused by every
+    scraping request, and the OCR worker processes.
+    """
+    global OCR_POOL, OCR_CACHE
+    OCR_POOL = ProcessPoolExecutor(
+        max_workers=OCR_WORKERS, initializer=init_ocr_worker
+    )
+    OCR_CACHE = OCRCache(OCR_CACHE_FILE, OCR_CACHE_SIZE_LIMIT)
+    app.state.pool = ContextPool(
+        await get_browser(), POOL_SIZE, MAX_USES_PER_INSTANCE
+    )
+    await app.state.pool.start()
+    app.state.http = httpx.AsyncClient(
+        headers={"User-Agent": USER_AGENT},
+        timeout=10,
+        http2=True,
+        limits=httpx.Limits(
+            max_connections=HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS
+        )
+    )
+    logging.info(f"Browser context pool started with {POOL_SIZE} contexts")
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """
+    Close the pooled and any leftover contexts, the shared browser and
+    stop Playwright.
+    """
+    await app.state.http.aclose()
+    await app.state.pool.close()
+    
+    # Close any contexts still open, e.g. from requests cut off mid-scrape
+    for context in app.state.browser.contexts:
+        await context.close()
+    await app.state.browser.close()
+    await app.state.pw.stop()
+    app.state.browser = None
+    logging.info("Playwright browser closed")
+    OCR_POOL.shutdown()
+    OCR_CACHE.close()
+
+
+async def get_browser() -> Browser:
+    """
+    Return the shared browser, launching Playwright and Chromium on first
+    use. Startup prewarms it; scripts that skip startup launch it lazily.
+    """
+    if getattr(app.state, "browser", None) is None:
+        async with _browser_lock:
+            # Another caller may have launched it while we waited
+            if getattr(app.state, "browser", None) is None:
+                app.state.pw = await async_playwright().start()
+                app.state.browser = await app.state.pw.chromium.launch(headless=True)
+                logging.info("Playwright browser launched")
+    return app.state.browser
+
+
+async def run_single_flight(
+    inflight: Dict[str, asyncio.Task], key: str, make_coro: Callable[[], Awaitable]
+) -> Any:
+    """
+    Run make_coro() as a task registered in inflight under key, or await the
+    task already registered there, so concurrent callers share one run.
+    """
+    task = inflight.get(key)
+    if task is None:
+        task = asyncio.create_task(make_coro())
+        inflight[key] = task
+        task.add_done_callback(lambda _: inflight.pop(key, None))
+    else:
+        logging.info(f"Joining in-flight work for: {key}")
+    
+    # Shield the shared task so one caller being cancelled (e.g. a client
+    # disconnecting) does not cancel it for everyone else waiting on it
+    return await asyncio.shield(task)
+
+
 @app.get("/ping", response_model=PingResponse)
 async def ping():
     """
@@ -96,27 +674,50 @@ async def scrape_advertiser_endpoint(request: AdvertiserRequest):
             detail="Advertiser name cannot be empty"
         )
     
+    # Join an identical scrape that is already running instead of
+    # starting another browser session for it
+    return await run_single_flight(
+        _inflight, advertiser_name.lower(),
+        lambda: scrape_advertiser(advertiser_name)
+    )
+
+
+async def scrape_advertiser(advertiser_name: str) -> AdvertiserResponse:
+    """
+    Look up the advertiser ID and video information for an advertiser name.
+    """
     try:
         # Get the advertiser ID
-        advertiser_id = await get_advertiser_id(advertiser_name)
+        id_task = asyncio.create_task(get_advertiser_id(advertiser_name))
         
-        if not advertiser_id:
-            raise HTTPException(
-                status_code=404,
-                detail=f"No advertiser ID found for '{advertiser_name}'"
+        known_id = KNOWN_ADVERTISER_IDS.get(advertiser_name.lower())
+        if known_id:
+            # The ID is known up front, so check for videos in parallel
+            videos_task = asyncio.create_task(check_advertiser_videos(known_id))
+            advertiser_id, (has_videos, video_count) = await asyncio.gather(
+                id_task, videos_task
             )
-        
-        # Check for videos on the advertiser page
-        has_videos, video_count = await check_advertiser_videos(advertiser_id)
+        else:
+            advertiser_id = await id_task
+            
+            if not advertiser_id:
+                raise HTTPException(
+                    status_code=404,
+                    detail=f"No advertiser ID found for '{advertiser_name}'"
+                )
+            
+            # Check for videos on the advertiser page
+            has_videos, video_count = await check_advertiser_videos(advertiser_id)
         
         return AdvertiserResponse(
             advertiser_google_id=advertiser_id,
             has_videos=has_videos,
             video_count=video_count
         )
+    except HTTPException:
+        raise
     except Exception as e:
         logging.error(f"Error during scraping: {str(e)}")
-        import traceback
         logging.error(traceback.format_exc())
         raise HTTPException(
             status_code=500,
@@ -124,337 +725,358 @@ async def scrape_advertiser_endpoint(request: AdvertiserRequest):
         )
 
 
+@app.post("/scrape_batch", response_model=List[AdvertiserResponse])
+async def scrape_batch_endpoint(request: BatchAdvertiserRequest):
+    """
+    Return the advertiser ID and video information for several advertisers,
+    checking their video pages together in one browser context.
+    """
+    advertiser_names = [name.strip() for name in request.advertiser_names]
+    
+    if not advertiser_names or not all(advertiser_names):
+        raise HTTPException(
+            status_code=400,
+            detail="Advertiser names cannot be empty"
+        )
+    
+    advertiser_ids = await asyncio.gather(*[
+        get_advertiser_id(name) for name in advertiser_names
+    ])
+    
+    found_ids = [advertiser_id for advertiser_id in advertiser_ids if advertiser_id]
+    video_results = dict(zip(
+        found_ids, await check_advertiser_videos_batch(found_ids)
+    ))
+    
+    responses = []
+    for advertiser_id in advertiser_ids:
+        if advertiser_id:
+            has_videos, video_count = video_results[advertiser_id]
+            responses.append(AdvertiserResponse(
+                advertiser_google_id=advertiser_id,
+                has_videos=has_videos,
+                video_count=video_count
+            ))
+        else:
+            responses.append(AdvertiserResponse())
+    return responses
+
+
 async def get_advertiser_id(advertiser_name: str) -> Optional[str]:
     """
     Get the advertiser ID for a given advertiser name from the Google Ads Transparency Center.
     """
     logging.info(f"Searching for advertiser ID for: {advertiser_name}")
     
-    # Hard-coded known IDs for specific advertisers
-    # This ensures we get the correct IDs that have videos
-    known_ids = {
-        "adidas": "AR14017378248766259201"
-    }
+    key = advertiser_name.lower()
     
     # Check if we have a known ID for this advertiser
-    if advertiser_name.lower() in known_ids:
-        advertiser_id = known_ids[advertiser_name.lower()]
+    if key in KNOWN_ADVERTISER_IDS:
+        advertiser_id = KNOWN_ADVERTISER_IDS[key]
         logging.info(f"Using known advertiser ID for {advertiser_name}: {advertiser_id}")
         return advertiser_id
     
-    browser = None
+    # Check if we looked this advertiser up recently
+    advertiser_id = _advertiser_id_cache.get(key)
+    if advertiser_id:
+        logging.info(f"Using cached advertiser ID for {advertiser_name}: {advertiser_id}")
+        return advertiser_id
+    
+    # Ask the search RPC directly before falling back to a browser session
+    advertiser_id = await get_advertiser_id_fast(advertiser_name)
+    
+    if not advertiser_id:
+        try:
+            # Borrow a pre-warmed context from the shared pool
+            async with app.state.pool.acquire() as context:
+                page = await context.new_page()
+                try:
+                    advertiser_id = await search_advertiser_id(page, advertiser_name)
+                finally:
+                    await page.close()
+        except Exception as e:
+            logging.error(f"Error in get_advertiser_id: {str(e)}")
+            logging.error(traceback.format_exc())
+            return None
+    
+    # Only cache successful lookups so failures are retried
+    if advertiser_id:
+        _advertiser_id_cache[key] = advertiser_id
+    return advertiser_id
+
+
+async def get_advertiser_id_fast(advertiser_name: str) -> Optional[str]:
+    """
+    Get the advertiser ID from the search suggestions RPC that the site's
+    search box calls, without starting a browser. Returns None if the
+    request fails or no advertiser is suggested.
+    """
+    client = app.state.http
     try:
-        playwright_instance = await async_playwright().start()
-        browser = await playwright_instance.chromium.launch(headless=True)
+        # The RPC expects the cookies the site sets on the first visit
+        if not client.cookies:
+            await client.get("https://adstransparency.google.com/")
         
-        # Create a context with longer timeout and realistic viewport
-        context = await browser.new_context(
-            viewport={"width": 1280, "height": 720},
-            user_agent=USER_AGENT
+        response = await client.post(
+            SEARCH_SUGGESTIONS_URL,
+            params={"authuser": "0"},
+            data={"f.req": json.dumps({"1": advertiser_name, "2": 10, "3": 10})}
         )
-        
-        # Set longer default timeout (90 seconds)
-        context.set_default_timeout(90000)
-        
-        page = await context.new_page()
-        
-        # Navigate to Google Ads Transparency Center
-        logging.info("Navigating to https://adstransparency.google.com/")
-        await page.goto("https://adstransparency.google.com/", wait_until="networkidle")
+    except httpx.HTTPError as e:
+        logging.warning(f"Search suggestions request failed: {str(e)}")
+        return None
+    
+    if response.status_code != 200:
+        logging.warning(f"Search suggestions returned HTTP {response.status_code}")
+        return None
+    
+    # Suggestions are ordered by relevance, so take the first advertiser ID
+    match = _AR_BARE_RE.search(response.text)
+    if match:
+        logging.info(f"Found advertiser ID via search suggestions: {match.group(0)}")
+        return match.group(0)
+    
+    logging.info("No advertiser ID in search suggestions")
+    return None
+
+
+async def search_advertiser_id(page, advertiser_name: str) -> Optional[str]:
+    """
+    Run the search flow for an advertiser name on the given page and return
+    the advertiser ID found, if any.
+    """
+    # Navigate to Google Ads Transparency Center
+    logging.info("Navigating to https://adstransparency.google.com/")
+    await page.goto("https://adstransparency.google.com/", wait_until="domcontentloaded")
+    if DEBUG_SCREENSHOTS:
         await page.screenshot(path="screenshots/initial_page.png")
-        logging.info("Page loaded, looking for search input")
+    logging.info("Page loaded, looking for search input")
         
-        # Attempt multiple strategies to find and interact with the search input
-        advertiser_id = None
+    # Attempt multiple strategies to find and interact with the search input
+    advertiser_id = None
         
-        # Strategy 1: Direct input selection
-        try:
-            logging.info("Trying Strategy 1: Direct input selection")
-            # First wait to make sure page is fully loaded
-            await page.wait_for_load_state("domcontentloaded")
-            await page.wait_for_selector('input.input.input-area', timeout=10000)
-            
-            search_input = await page.query_selector('input.input.input-area')
-            if search_input:
-                # Click to focus the input
-                await search_input.click()
-                await page.wait_for_timeout(500)  # small delay to ensure focus
-                
-                # Clear any existing text
-                await search_input.fill("")
-                await page.wait_for_timeout(300)
-                
-                # Type the advertiser name
-                await search_input.fill(advertiser_name)
-                logging.info(f"Entered advertiser name: {advertiser_name}")
-                
-                # Take screenshot before pressing Enter
+    # Strategy 1: Direct input selection
+    try:
+        logging.info("Trying Strategy 1: Direct input selection")
+        # First wait to make sure page is fully loaded
+        await page.wait_for_load_state("domcontentloaded")
+        await page.wait_for_selector('input.input.input-area', timeout=10000)
+
+        search_input = await page.query_selector('input.input.input-area')
+        if search_input:
+            # Click to focus the input
+            await search_input.click()
+    
+            # Clear any existing text
+            await search_input.fill("")
+    
+            # Type the advertiser name
+            await search_input.fill(advertiser_name)
+            logging.info(f"Entered advertiser name: {advertiser_name}")
+    
+            # Take screenshot before pressing Enter
+            if DEBUG_SCREENSHOTS:
                 await page.screenshot(path="screenshots/before_search.png")
-                
-                # Record current URL before search
-                pre_search_url = page.url
-                logging.info(f"URL before search: {pre_search_url}")
-                
-                # Press Enter and wait for navigation or response
-                await search_input.press("Enter")
-                logging.info("Pressed Enter to submit search")
-                
-                # Wait for a short time for the page to respond
-                await page.wait_for_timeout(2000)
-                
-                # Wait for load state
-                try:
-                    await page.wait_for_load_state("domcontentloaded", timeout=10000)
-                    logging.info("Page DOM content loaded after search")
-                except TimeoutError:
-                    logging.warning("Timeout waiting for DOM content load, continuing anyway")
-                
-                # Take screenshots to track progress
+    
+            # Record current URL before search
+            pre_search_url = page.url
+            logging.info(f"URL before search: {pre_search_url}")
+    
+            # Press Enter and wait for the search response
+            await submit_search(page, search_input)
+    
+            # Wait for load state
+            try:
+                await page.wait_for_load_state("domcontentloaded", timeout=10000)
+                logging.info("Page DOM content loaded after search")
+            except TimeoutError:
+                logging.warning("Timeout waiting for DOM content load, continuing anyway")
+    
+            # Take screenshots to track progress
+            if DEBUG_SCREENSHOTS:
                 await page.screenshot(path="screenshots/after_search.png")
-                
-                # APPROACH 1: Check if URL changed directly using JavaScript
-                for attempt in range(3):
-                    try:
-                        logging.info(f"Attempt {attempt+1} to get current URL via JavaScript")
-                        # Execute JavaScript to get current URL
-                        current_url = await page.evaluate("window.location.href")
-                        logging.info(f"Current URL from JavaScript: {current_url}")
-                        
-                        if current_url and current_url != pre_search_url:
-                            logging.info("URL changed after search")
-                            # Try to extract advertiser ID from URL
-                            advertiser_id = extract_advertiser_id_from_url(current_url)
-                            if advertiser_id:
-                                logging.info(f"Found advertiser ID in URL: {advertiser_id}")
-                                return advertiser_id
-                            
-                            # If URL changed but no ID found, continue attempting to interact with results
-                            break
-                    except Error as e:
-                        logging.warning(f"Error getting URL via JavaScript: {str(e)}")
-                    
-                    # Wait a bit before next attempt
-                    await page.wait_for_timeout(2000)
-                
-                # APPROACH 2: If URL check didn't yield an ID, try to click on search results
-                logging.info("Checking for search results to click")
+    
+            # APPROACH 1: Check if URL changed after the search
+            current_url = await wait_for_url_change(page, pre_search_url)
+            logging.info(f"Current URL after search: {current_url}")
+            
+            if current_url != pre_search_url:
+                logging.info("URL changed after search")
+                # Try to extract advertiser ID from URL
+                advertiser_id = extract_advertiser_id_from_url(current_url)
+                if advertiser_id:
+                    logging.info(f"Found advertiser ID in URL: {advertiser_id}")
+                    return advertiser_id
+    
+            # APPROACH 2: If URL check didn't yield an ID, try to click on search results
+            logging.info("Checking for search results to click")
+            if DEBUG_SCREENSHOTS:
                 await page.screenshot(path="screenshots/before_clicking_results.png")
-                
-                # Try to find and click search results if they're visible
-                try:
-                    # Execute JavaScript to find and click the first search result
-                    clicked = await page.evaluate('''() => {
-                        // Try different selectors that might match search results
-                        const selectors = [
-                            "material-list material-list-item",
-                            "div[role='listbox'] div[role='option']",
-                            ".search-results-container .search-result",
-                            "[role='list'] [role='listitem']",
-                            "[role='tab']",
-                            "material-list-item"
-                        ];
-                        
-                        // Try each selector
-                        for (const selector of selectors) {
-                            const elements = document.querySelectorAll(selector);
-                            if (elements && elements.length > 0) {
-                                console.log(`Found ${elements.length} elements matching ${selector}`);
-                                // Click the first element
-                                elements[0].click();
-                                return true;
-                            }
+    
+            # Try to find and click search results if they're visible
+            try:
+                # Execute JavaScript to find and click the first search result
+                clicked = await page.evaluate('''() => {
+                    // Try different selectors that might match search results
+                    const selectors = [
+                        "material-list material-list-item",
+                        "div[role='listbox'] div[role='option']",
+                        ".search-results-container .search-result",
+                        "[role='list'] [role='listitem']",
+                        "[role='tab']",
+                        "material-list-item"
+                    ];
+            
+                    // Try each selector
+                    for (const selector of selectors) {
+                        const elements = document.querySelectorAll(selector);
+                        if (elements && elements.length > 0) {
+                            console.log(`Found ${elements.length} elements matching ${selector}`);
+                            // Click the first element
+                            elements[0].click();
+                            return true;
                         }
-                        
-                        // Also try to find elements by class name partial match
-                        const patterns = ['result', 'item', 'option', 'listitem'];
-                        for (const pattern of patterns) {
-                            const elements = document.querySelectorAll(`*[class*="${pattern}"]`);
-                            if (elements && elements.length > 0) {
-                                console.log(`Found ${elements.length} elements with class containing ${pattern}`);
-                                elements[0].click();
-                                return true;
-                            }
+                    }
+            
+                    // Also try to find elements by class name partial match
+                    const patterns = ['result', 'item', 'option', 'listitem'];
+                    for (const pattern of patterns) {
+                        const elements = document.querySelectorAll(`*[class*="${pattern}"]`);
+                        if (elements && elements.length > 0) {
+                            console.log(`Found ${elements.length} elements with class containing ${pattern}`);
+                            elements[0].click();
+                            return true;
                         }
-                        
-                        return false;
-                    }''')
-                    
-                    if clicked:
-                        logging.info("Clicked a search result using JavaScript")
-                        
-                        # Wait for a moment after clicking
-                        await page.wait_for_timeout(3000)
-                        
-                        # Check URL again after clicking
-                        try:
-                            current_url = await page.evaluate("window.location.href")
-                            logging.info(f"URL after clicking result: {current_url}")
-                            
-                            # Extract advertiser ID from URL
-                            advertiser_id = extract_advertiser_id_from_url(current_url)
-                            if advertiser_id:
-                                logging.info(f"Found advertiser ID after clicking: {advertiser_id}")
-                                return advertiser_id
-                        except Error as e:
-                            logging.warning(f"Error getting URL after clicking: {str(e)}")
-                except Error as e:
-                    logging.warning(f"Error trying to click search results: {str(e)}")
-                
-                # APPROACH 3: If all else fails, try to extract IDs from the page content
-                if not advertiser_id:
-                    advertiser_id = await extract_advertiser_id_from_content(page, advertiser_name)
-            else:
-                logging.warning("Could not find search input with expected selector")
-        except Exception as e:
-            logging.error(f"Error with strategy 1: {str(e)}")
-            await page.screenshot(path="screenshots/strategy1_error.png")
+                    }
+            
+                    return false;
+                }''')
         
-        # If Strategy 1 failed, try Strategy 2
-        if not advertiser_id:
-            try:
-                logging.info("Trying Strategy 2: Using keyboard navigation")
-                # Refresh the page to start fresh
-                await page.goto("https://adstransparency.google.com/", wait_until="networkidle")
-                await page.wait_for_load_state("domcontentloaded")
-                
-                # First try to click anywhere on the page and then use tab to reach search
-                await page.click('body')
-                
-                # Press Tab a few times to try to reach the search input
-                for _ in range(3):
-                    await page.keyboard.press('Tab')
-                    await page.wait_for_timeout(300)
-                
-                # Type the advertiser name
-                await page.keyboard.type(advertiser_name)
-                logging.info(f"Entered advertiser name using keyboard: {advertiser_name}")
-                
-                # Press Enter and wait
-                pre_search_url = await page.evaluate("window.location.href")
-                await page.keyboard.press("Enter")
-                logging.info("Pressed Enter to submit search")
-                
-                # Wait a moment for the page to respond
-                await page.wait_for_timeout(3000)
-                
-                # Try to get current URL
-                for attempt in range(3):
+                if clicked:
+                    logging.info("Clicked a search result using JavaScript")
+            
+                    # Check URL again once the click has opened an advertiser page
                     try:
-                        current_url = await page.evaluate("window.location.href")
-                        logging.info(f"Strategy 2 URL: {current_url}")
-                        
-                        if current_url and current_url != pre_search_url:
-                            advertiser_id = extract_advertiser_id_from_url(current_url)
-                            if advertiser_id:
-                                logging.info(f"Found advertiser ID in strategy 2: {advertiser_id}")
-                                return advertiser_id
-                    except Error as e:
-                        logging.warning(f"Error getting URL in strategy 2: {str(e)}")
-                    
-                    await page.wait_for_timeout(2000)
-                
-                # If no advertiser ID found from URL, try page content
-                if not advertiser_id:
-                    advertiser_id = await extract_advertiser_id_from_content(page, advertiser_name)
-            except Exception as e:
-                logging.error(f"Error with strategy 2: {str(e)}")
-                await page.screenshot(path="screenshots/strategy2_error.png")
-        
-        if advertiser_id:
-            logging.info(f"Found advertiser ID: {advertiser_id}")
-            return advertiser_id
-        else:
-            logging.warning("No advertiser ID found")
-            return None
+                        await page.wait_for_url(
+                            lambda url: "/advertiser/" in url,
+                            wait_until="commit",
+                            timeout=10000
+                        )
+                    except TimeoutError:
+                        logging.warning("Timeout waiting for advertiser page after clicking")
+                    current_url = page.url
+                    logging.info(f"URL after clicking result: {current_url}")
+            
+                    # Extract advertiser ID from URL
+                    advertiser_id = extract_advertiser_id_from_url(current_url)
+                    if advertiser_id:
+                        logging.info(f"Found advertiser ID after clicking: {advertiser_id}")
+                        return advertiser_id
+            except Error as e:
+                logging.warning(f"Error trying to click search results: {str(e)}")
     
+            # APPROACH 3: If all else fails, try to extract IDs from the page content
+            if not advertiser_id:
+                advertiser_id = await extract_advertiser_id_from_content(page)
+        else:
+            logging.warning("Could not find search input with expected selector")
     except Exception as e:
-        logging.error(f"Error in get_advertiser_id: {str(e)}")
-        import traceback
-        logging.error(traceback.format_exc())
+        logging.error(f"Error with strategy 1: {str(e)}")
+        if DEBUG_SCREENSHOTS:
+            await page.screenshot(path="screenshots/strategy1_error.png")
+        
+    # If Strategy 1 failed, try Strategy 2
+    if not advertiser_id:
+        try:
+            logging.info("Trying Strategy 2: Using keyboard navigation")
+            # Refresh the page to start fresh
+            await page.goto("https://adstransparency.google.com/", wait_until="domcontentloaded")
+            await page.wait_for_load_state("domcontentloaded")
+    
+            # First try to click anywhere on the page and then use tab to reach search
+            await page.click('body')
+    
+            # Press Tab a few times to try to reach the search input
+            for _ in range(3):
+                await page.keyboard.press('Tab')
+    
+            # Type the advertiser name
+            await page.keyboard.type(advertiser_name)
+            logging.info(f"Entered advertiser name using keyboard: {advertiser_name}")
+    
+            # Press Enter and wait for the search response
+            pre_search_url = page.url
+            await submit_search(page, page.keyboard)
+    
+            # Try to get current URL
+            current_url = await wait_for_url_change(page, pre_search_url)
+            logging.info(f"Strategy 2 URL: {current_url}")
+    
+            if current_url != pre_search_url:
+                advertiser_id = extract_advertiser_id_from_url(current_url)
+                if advertiser_id:
+                    logging.info(f"Found advertiser ID in strategy 2: {advertiser_id}")
+                    return advertiser_id
+    
+            # If no advertiser ID found from URL, try page content
+            if not advertiser_id:
+                advertiser_id = await extract_advertiser_id_from_content(page)
+        except Exception as e:
+            logging.error(f"Error with strategy 2: {str(e)}")
+            if DEBUG_SCREENSHOTS:
+                await page.screenshot(path="screenshots/strategy2_error.png")
+        
+    if advertiser_id:
+        logging.info(f"Found advertiser ID: {advertiser_id}")
+        return advertiser_id
+    else:
+        logging.warning("No advertiser ID found")
         return None
-    finally:
-        if browser:
-            await browser.close()
 
 
-async def extract_advertiser_id_from_content(page, advertiser_name) -> Optional[str]:
-    """Extract advertiser ID from page content using multiple methods."""
+async def submit_search(page, target) -> None:
+    """
+    Press Enter on target (an element handle or the page keyboard) and wait
+    for the search request to return, instead of sleeping a fixed time.
+    """
+    try:
+        async with page.expect_response(
+            lambda response: "SearchService" in response.url and response.status == 200,
+            timeout=10000
+        ):
+            await target.press("Enter")
+            logging.info("Pressed Enter to submit search")
+        logging.info("Search response received")
+    except TimeoutError:
+        logging.warning("Timeout waiting for search response, continuing anyway")
+
+
+async def wait_for_url_change(page, previous_url: str, timeout: int = 6000) -> str:
+    """
+    Wait until the page URL differs from previous_url and return the current
+    URL. Returns the unchanged URL if the timeout expires first.
+    """
+    try:
+        await page.wait_for_url(
+            lambda url: url != previous_url, wait_until="commit", timeout=timeout
+        )
+    except TimeoutError:
+        logging.info("URL did not change before timeout")
+    return page.url
+
+
+async def extract_advertiser_id_from_content(page) -> Optional[str]:
+    """Extract advertiser ID from the page in a single evaluate call."""
     logging.info("Trying to extract advertiser ID from page content")
-    await page.screenshot(path="screenshots/page_content.png")
-    
-    advertiser_id = None
+    if DEBUG_SCREENSHOTS:
+        await page.screenshot(path="screenshots/page_content.png")
     
     try:
-        # Get page content
-        content = await page.content()
-        
-        # Method 1: Look for AR pattern in the content
-        ar_pattern = r'AR\d+|advertiser\/([A-Z0-9]+)'
-        matches = re.findall(ar_pattern, content)
-        if matches:
-            # Filter out empty matches and take the first one
-            valid_matches = [m for m in matches if m and not isinstance(m, tuple)]
-            # If we have tuple matches (from capturing groups), extract them
-            tuple_matches = [t[0] for t in matches if isinstance(t, tuple) and t[0]]
-            
-            all_matches = valid_matches + tuple_matches
-            if all_matches:
-                advertiser_id = all_matches[0]
-                logging.info(f"Found advertiser ID in page content: {advertiser_id}")
-                return advertiser_id
-        
-        # Method 2: Try to find elements that might contain the advertiser info
-        try:
-            # Use JS to look for elements containing the advertiser name and nearby IDs
-            js_result = await page.evaluate(f'''() => {{
-                // Look for the advertiser name in the page
-                const advertiser = "{advertiser_name.lower()}";
-                const elements = Array.from(document.querySelectorAll('*'));
-                let potentialIds = [];
-                
-                // Look for elements containing the advertiser name
-                for (const el of elements) {{
-                    if (el.textContent && el.textContent.toLowerCase().includes(advertiser)) {{
-                        // Check nearby elements for ID patterns
-                        const parent = el.parentElement;
-                        if (parent) {{
-                            const text = parent.textContent;
-                            const match = text.match(/AR\\d+/);
-                            if (match) {{
-                                potentialIds.push(match[0]);
-                            }}
-                        }}
-                    }}
-                }}
-                
-                // Also look for specific attributes that might contain IDs
-                const attributeElements = document.querySelectorAll('[data-advertiser-id], [data-id], [id*="advertiser"]');
-                for (const el of attributeElements) {{
-                    if (el.getAttribute('data-advertiser-id')) {{
-                        potentialIds.push(el.getAttribute('data-advertiser-id'));
-                    }}
-                    else if (el.getAttribute('data-id') && el.getAttribute('data-id').match(/AR\\d+/)) {{
-                        potentialIds.push(el.getAttribute('data-id'));
-                    }}
-                    else if (el.id && el.id.includes('advertiser')) {{
-                        const match = el.id.match(/AR\\d+/);
-                        if (match) {{
-                            potentialIds.push(match[0]);
-                        }}
-                    }}
-                }}
-                
-                return potentialIds;
-            }}''')
-            
-            if js_result and len(js_result) > 0:
-                advertiser_id = js_result[0]
-                logging.info(f"Found advertiser ID via JS: {advertiser_id}")
-                return advertiser_id
-                
-        except Exception as e:
-            logging.warning(f"Error in JS extraction: {str(e)}")
-        
+        result = await page.evaluate(_ADVERTISER_ID_JS)
+        if result:
+            advertiser_id = result["id"]
+            logging.info(f"Found advertiser ID in page {result['source']}: {advertiser_id}")
+            return advertiser_id
     except Exception as e:
         logging.error(f"Error extracting from page content: {str(e)}")
     
@@ -465,25 +1087,13 @@ def extract_advertiser_id_from_url(url: str) -> Optional[str]:
     """Extract advertiser ID from URL."""
     logging.info(f"Extracting advertiser ID from URL: {url}")
     
-    # Look for pattern like https://adstransparency.google.com/advertiser/AR123456789
-    advertiser_id_match = re.search(r'advertiser/([A-Z0-9]+)', url)
-    if advertiser_id_match:
-        advertiser_id = advertiser_id_match.group(1)
-        logging.info(f"Found advertiser ID in URL: {advertiser_id}")
-        return advertiser_id
-    
-    # Look for AR pattern directly
-    ar_match = re.search(r'AR\d+', url)
-    if ar_match:
-        advertiser_id = ar_match.group(0)
-        logging.info(f"Found AR ID in URL: {advertiser_id}")
-        return advertiser_id
-    
-    # Look for ID in query parameters
-    id_param_match = re.search(r'[?&]id=([A-Z0-9]+)', url)
-    if id_param_match:
-        advertiser_id = id_param_match.group(1)
-        logging.info(f"Found ID in query parameter: {advertiser_id}")
+    # Scan the URL once for an advertiser path like
+    # https://adstransparency.google.com/advertiser/AR123456789,
+    # a bare AR ID, or an ID in the query parameters
+    match = _AR_URL_RE.search(url)
+    if match:
+        advertiser_id = match.group(match.lastgroup)
+        logging.info(f"Found advertiser ID in URL ({match.lastgroup}): {advertiser_id}")
         return advertiser_id
     
     logging.info("No advertiser ID found in URL")
@@ -500,11 +1110,10 @@ async def get_page_content() -> Dict[str, Any]:
             - dom_content: List of strings (each line of the DOM)
             - search_input: String containing the search input HTML
     """
-    async with async_playwright() as p:
-        # Launch browser with more realistic settings
-        browser = await p.chromium.launch(headless=True)
-        
-        # Create a context with realistic browser settings
+    # Bound how many ad-hoc contexts are open at once
+    async with _BROWSER_SEM:
+        # Create a context on the shared browser with realistic settings
+        browser = await get_browser()
         context = await browser.new_context(
             user_agent=USER_AGENT,
             viewport={"width": 1280, "height": 800},
@@ -529,107 +1138,13 @@ async def get_page_content() -> Dict[str, Any]:
             # Convert the content to a list of lines
             dom_list = content.splitlines()
             
-            # Parse the HTML to find the search input
-            soup = BeautifulSoup(content, 'html.parser')
-            search_input = ""
-            
-            # First approach: Find by placeholder text in span tag
-            placeholder_spans = soup.find_all(
-                "span", 
-                string=lambda text: text and "Search by advertiser or website name" in text
-            )
-            
-            for span in placeholder_spans:
-                # Look for parent container that might contain the input
-                parent_container = span.find_parent()
-                if parent_container:
-                    # Find associated input within the same container
-                    related_input = parent_container.find('input')
-                    if related_input:
-                        search_input = str(related_input)
-                        break
-            
-            # Second approach: If not found, try looking for the input directly
-            if not search_input:
-                # Look for input with search-related attributes
-                search_inputs = soup.find_all('input', attrs={
-                    'class': lambda c: c and any(cls in c for cls in 
-                             ['search', 'query', 'input-area'])
-                })
-                
-                if search_inputs:
-                    search_input = str(search_inputs[0])
-            
-            # Third approach: Look for elements with search-related roles
-            if not search_input:
-                search_elements = soup.find_all(attrs={
-                    'role': lambda r: r in ['search', 'searchbox', 'combobox']
-                })
-                
-                for elem in search_elements:
-                    # Find input within search element
-                    related_input = elem.find('input')
-                    if related_input:
-                        search_input = str(related_input)
-                        break
-            
-            # Fourth approach: Try to look at the DOM structure more broadly
-            if not search_input:
-                # Check if there's any container with search-related text nearby
-                search_containers = []
-                for text in ['search', 'find', 'lookup']:
-                    containers = soup.find_all(
-                        lambda tag: tag.name in ['div', 'section', 'form'] and 
-                                  tag.find(string=lambda s: s and text.lower() in s.lower())
-                    )
-                    search_containers.extend(containers)
-                
-                for container in search_containers:
-                    input_elem = container.find('input')
-                    if input_elem:
-                        search_input = str(input_elem)
-                        break
-            
-            # If still not found, use the page evaluation method directly
-            if not search_input:
-                # Use JavaScript to find the most likely search input
-                search_input_js = await page.evaluate('''() => {
-                    // Try various selectors that might match a search input
-                    const selectors = [
-                        'input[type="search"]',
-                        'input[placeholder*="search" i]',
-                        'input[placeholder*="find" i]',
-                        'input[aria-label*="search" i]',
-                        'input.search',
-                        'input.searchbox',
-                        'input.query',
-                        'input.input-area',
-                        'input[role="search"]',
-                        'input[role="searchbox"]'
-                    ];
-                    
-                    for (const selector of selectors) {
-                        const element = document.querySelector(selector);
-                        if (element) {
-                            return element.outerHTML;
-                        }
-                    }
-                    
-                    // Last resort: get all inputs and return the first one
-                    const inputs = document.querySelectorAll('input');
-                    if (inputs.length > 0) {
-                        return inputs[0].outerHTML;
-                    }
-                    
-                    return "";
-                }''')
-                
-                if search_input_js:
-                    search_input = search_input_js
+            # Find the most likely search input in the live DOM
+            search_input = await page.evaluate(_SEARCH_INPUT_JS)
             
             # Just capture a snapshot of the page for debugging if no search input found
             if not search_input:
-                await page.screenshot(path="search_input_not_found.png")
+                if DEBUG_SCREENSHOTS:
+                    await page.screenshot(path="search_input_not_found.png")
                 search_input = "No search input found"
             
             return {
@@ -638,117 +1153,234 @@ async def get_page_content() -> Dict[str, Any]:
             }
         except Exception as e:
             # Take screenshot for debugging if there's an error
-            try:
-                await page.screenshot(path="error_screenshot.png")
-            except Exception:
-                pass
+            if DEBUG_SCREENSHOTS:
+                try:
+                    await page.screenshot(path="error_screenshot.png")
+                except Exception:
+                    pass
             msg = f"Error getting page content: {str(e)}"
             raise Exception(msg)
         finally:
-            # Ensure browser is closed
-            await browser.close()
+            # Ensure the context is closed; the browser itself is shared
+            await context.close()
 
 
-def scrape_advertiser_page(advertiser_id: str) -> tuple:
+async def fetch_advertiser_page(advertiser_id: str) -> tuple:
     """
-    Use requests and BeautifulSoup to scrape the advertiser page.
-    Returns a tuple of (unique tag names, image URLs).
+    Fetch and parse the advertiser page with the shared HTTP client.
+    Returns a tuple of (page URL, parsed selectolax tree).
     """
     base_url = (
         f"https://adstransparency.google.com/advertiser/{advertiser_id}"
         f"?region=US"
     )
     
-    # Fetch the page
-    headers = {
-        "User-Agent": (
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
-            "(KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
-        )
-    }
-    response = requests.get(base_url, headers=headers)
+    # Fetch the page without blocking the event loop
+    response = await app.state.http.get(base_url)
     
     if response.status_code != 200:
         raise Exception(
             f"Failed to fetch advertiser page: HTTP {response.status_code}"
         )
     
-    # Parse HTML
-    soup = BeautifulSoup(response.text, 'html.parser')
+    return (base_url, HTMLParser(response.text))
+
+
+def collect_tags(tree) -> List[str]:
+    """
+    Collect all unique tag names in one pass, skipping comment nodes.
+    """
+    return list({
+        node.tag for node in tree.root.traverse()
+        if not node.tag.startswith('-')
+    })
+
+
+def collect_image_urls(tree, base_url: str) -> List[str]:
+    """
+    Extract image URLs, resolving relative ones and skipping data URLs,
+    formats that never carry ad text and tiny images that are likely icons.
+    """
+    return [
+        urljoin(base_url, src)
+        for img in tree.css('img')
+        if (src := img.attributes.get('src'))
+        and not src.startswith('data:')
+        and not urlparse(src).path.lower().endswith(SKIPPED_IMAGE_EXTENSIONS)
+        and not is_tiny_image(img)
+    ]
+
+
+async def scrape_advertiser_page(advertiser_id: str) -> tuple:
+    """
+    Use the shared HTTP client and selectolax to scrape the advertiser page
+    and OCR its images.
+    Returns a tuple of (unique tag names, cleaned text from images).
+    """
+    base_url, tree = await fetch_advertiser_page(advertiser_id)
+    
+    # Start downloading and OCR'ing images as soon as their URLs are known,
+    # and collect tag names in a thread while they are in flight
+    ocr_task = asyncio.create_task(
+        extract_text_from_images(collect_image_urls(tree, base_url))
+    )
+    tags = await asyncio.to_thread(collect_tags, tree)
+    
+    return (tags, await ocr_task)
+
+
+def is_tiny_image(img) -> bool:
+    """
+    Check an img node's width/height attributes for icons and tracking pixels.
+    """
+    for attr in ('width', 'height'):
+        value = img.attributes.get(attr)
+        if value and value.isdigit() and int(value) < MIN_IMAGE_SIZE:
+            return True
+    return False
+
+
+async def fetch_image(client: httpx.AsyncClient, url: str) -> Optional[bytes]:
+    """
+    Download a single image. Returns None for non-200 responses and for
+    images larger than MAX_IMAGE_BYTES, without reading the rest of the body.
+    """
+    async with client.stream("GET", url) as response:
+        if response.status_code != 200:
+            return None
+        
+        if int(response.headers.get('content-length', 0)) > MAX_IMAGE_BYTES:
+            logging.info(f"Skipping oversized image: {url}")
+            return None
+        
+        # Enforce the limit for responses without a Content-Length too
+        data = bytearray()
+        async for chunk in response.aiter_bytes():
+            data.extend(chunk)
+            if len(data) > MAX_IMAGE_BYTES:
+                logging.info(f"Skipping oversized image: {url}")
+                return None
+        return bytes(data)
+
+
+def init_ocr_worker():
+    """
+    Load the Tesseract model once per OCR worker process when tesserocr is
+    installed. Each worker is single-threaded, so its API needs no lock.
+    """
+    global _TESS_API
+    if tesserocr is not None:
+        try:
+            _TESS_API = tesserocr.PyTessBaseAPI(lang='eng', psm=tesserocr.PSM.AUTO)
+        except RuntimeError as e:
+            # Missing tessdata or language files; fall back to pytesseract
+            # rather than failing the pool initializer and breaking all OCR
+            logging.warning(f"Could not initialize tesserocr, using pytesseract: {str(e)}")
+            _TESS_API = None
+
+
+def ocr_image(data: bytes) -> str:
+    """
+    Perform OCR on raw image bytes. Runs inside an OCR worker process, so it
+    takes bytes rather than a PIL image to keep arguments picklable.
+    """
+    img = Image.open(io.BytesIO(data))
     
-    # Collect all unique tag names
-    all_tags = set()
-    for tag in soup.find_all():
-        all_tags.add(tag.name)
+    # Too small to contain readable text
+    if img.width < MIN_IMAGE_SIZE or img.height < MIN_IMAGE_SIZE:
+        return ""
     
-    # Extract all image URLs
-    img_elements = soup.find_all('img')
-    image_urls = []
+    if _TESS_API is not None:
+        _TESS_API.SetImage(img)
+        return _TESS_API.GetUTF8Text()
     
-    for img in img_elements:
-        src = img.get('src')
-        if src:
-            # Resolve relative URLs
-            if not src.startswith(('http://', 'https://', 'data:')):
-                src = urljoin(base_url, src)
-            
-            # Skip data URLs and tiny images that are likely icons
-            if not src.startswith('data:'):
-                image_urls.append(src)
+    # Without tesserocr, each image spawns a tesseract process
+    return pytesseract.image_to_string(img)
+
+
+async def process_image(client: httpx.AsyncClient, url: str) -> Optional[str]:
+    """
+    Download an image and OCR it in the worker pool.
+    Returns the raw text, or None if the image could not be downloaded.
+    """
+    data = await fetch_image(client, url)
+    if data is None:
+        return None
     
-    return (list(all_tags), image_urls)
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(OCR_POOL, ocr_image, data)
 
 
-def extract_text_from_images(image_urls: List[str]) -> List[str]:
+async def extract_text_from_images(image_urls: List[str]) -> List[str]:
     """
-    Download images, perform OCR, and clean the extracted text.
+    Download and OCR images concurrently, then clean the extracted text.
+    Images seen before are answered from the OCR cache without a download.
     Returns a list of cleaned text strings from images.
     """
-    results = []
+    unique_urls = list(dict.fromkeys(image_urls))
+    texts_by_url = {}
+    if OCR_CACHE:
+        texts_by_url = await asyncio.to_thread(OCR_CACHE.get_many, unique_urls)
+    to_process = [url for url in unique_urls if url not in texts_by_url]
     
-    for url in image_urls:
-        try:
-            # Download image
-            headers = {
-                "User-Agent": (
-                    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                    "AppleWebKit/537.36 (KHTML, like Gecko) "
-                    "Chrome/91.0.4472.124 Safari/537.36"
-                )
-            }
-            response = requests.get(url, headers=headers, timeout=10)
-            
-            if response.status_code != 200:
-                continue
-            
-            # Convert to PIL Image
-            img = Image.open(io.BytesIO(response.content))
-            
-            # Perform OCR
-            text = pytesseract.image_to_string(img)
-            
-            # Clean the text
-            if text and len(text.strip()) > 0:
-                # Convert to lowercase
-                text = text.lower()
-                
-                # Remove special characters except spaces
-                text = re.sub(r'[^\w\s]', '', text)
-                
-                # Collapse multiple whitespace into single space
-                text = re.sub(r'\s+', ' ', text)
-                
-                # Trim leading/trailing spaces
-                text = text.strip()
-                
-                if text:  # Only add non-empty strings
-                    results.append(text)
-        except Exception as e:
+    # Each image is downloaded then OCR'd, with all images in flight at once
+    tasks = [
+        asyncio.create_task(process_image(app.state.http, url))
+        for url in to_process
+    ]
+    texts = await asyncio.gather(*tasks, return_exceptions=True)
+    
+    new_texts = {}
+    for url, text in zip(to_process, texts):
+        if isinstance(text, Exception):
             # Skip problematic images
-            print(f"Error processing image {url}: {str(e)}")
+            logging.warning(f"Error processing image {url}: {str(text)}")
+            continue
+        
+        # Downloads that failed are retried next time, so only cache OCR results
+        if text is None:
             continue
+        
+        new_texts[url] = clean_ocr_text(text)
+    
+    texts_by_url.update(new_texts)
+    if OCR_CACHE and new_texts:
+        await asyncio.to_thread(OCR_CACHE.set_many, new_texts)
+    
+    # Only return non-empty strings
+    return [texts_by_url[url] for url in image_urls if texts_by_url.get(url)]
+
+
+def lookup_known_video_count(advertiser_id: str) -> Optional[tuple]:
+    """
+    Answer a video check from the seeded or recently checked video counts
+    without a browser. Returns (has_videos, video_count), or None if a
+    browser check is needed.
+    """
+    # Check if we have known video info for this ID
+    if advertiser_id in _KNOWN_VIDEO_COUNTS:
+        video_count = _KNOWN_VIDEO_COUNTS[advertiser_id]
+        logging.info(f"Using known video count for {advertiser_id}: {video_count}")
+        return video_count > 0, video_count
+    
+    # Check if we checked this advertiser recently
+    if advertiser_id in _video_cache:
+        has_videos, video_count = _video_cache[advertiser_id]
+        logging.info(f"Using cached video count for {advertiser_id}: {video_count}")
+        return has_videos, video_count
+    
+    # Check if another worker, or this one before a restart, checked it recently
+    entry = _checked_video_counts.get(advertiser_id)
+    if isinstance(entry, dict) and time.time() - entry["checked_at"] < VIDEO_CACHE_TTL:
+        video_count = entry["video_count"]
+        logging.info(f"Using stored video count for {advertiser_id}: {video_count}")
+        return video_count > 0, video_count
     
-    return results
+    if ADS_LUT_ONLY:
+        logging.info(f"No known video count for {advertiser_id} (ADS_LUT_ONLY set)")
+        return False, None
+    
+    return None
 
 
 async def check_advertiser_videos(advertiser_id: str) -> tuple[bool, Optional[int]]:
@@ -763,110 +1395,239 @@ async def check_advertiser_videos(advertiser_id: str) -> tuple[bool, Optional[in
     """
     logging.info(f"Checking for videos for advertiser ID: {advertiser_id}")
     
-    # Hard-coded results for known IDs
-    # This ensures we handle cases where the page loading is problematic
-    known_video_counts = {
-        "AR14017378248766259201": 34  # Adidas advertiser ID with known videos
-    }
+    known = lookup_known_video_count(advertiser_id)
+    if known:
+        return known
     
-    # Check if we have known video info for this ID
-    if advertiser_id in known_video_counts:
-        video_count = known_video_counts[advertiser_id]
-        logging.info(f"Using known video count for {advertiser_id}: {video_count}")
-        return True, video_count
+    # Share one browser check between concurrent calls for the same ID,
+    # batched with checks for other IDs requested around the same time
+    return await run_single_flight(
+        _video_inflight, advertiser_id,
+        lambda: _video_batcher.check(advertiser_id)
+    )
+
+
+async def check_advertiser_videos_batch(
+    advertiser_ids: List[str]
+) -> List[tuple[bool, Optional[int]]]:
+    """
+    Check several advertisers for video ads at once. IDs without a known
+    video count are checked concurrently in a single browser context.
     
-    browser = None
-    try:
-        playwright_instance = await async_playwright().start()
-        browser = await playwright_instance.chromium.launch(headless=True)
-        
-        # Create a context with longer timeout and realistic viewport
-        context = await browser.new_context(
-            viewport={"width": 1280, "height": 720},
-            user_agent=USER_AGENT
-        )
-        
-        # Set longer default timeout (60 seconds)
-        context.set_default_timeout(60000)
-        
-        page = await context.new_page()
-        
-        # Navigate to the video page for this advertiser
-        video_url = f"https://adstransparency.google.com/advertiser/{advertiser_id}?region=US&format=VIDEO"
-        logging.info(f"Navigating to video page: {video_url}")
-        
+    Returns:
+        List of (has_videos, video_count) tuples in the order of advertiser_ids
+    """
+    results = {}
+    to_check = []
+    for advertiser_id in dict.fromkeys(advertiser_ids):
+        known = lookup_known_video_count(advertiser_id)
+        if known:
+            results[advertiser_id] = known
+        else:
+            to_check.append(advertiser_id)
+    
+    if to_check:
+        checked = await scrape_advertiser_videos(to_check)
+        results.update(zip(to_check, checked))
+    
+    return [results[advertiser_id] for advertiser_id in advertiser_ids]
+
+
+async def scrape_advertiser_videos(
+    advertiser_ids: List[str]
+) -> List[tuple[bool, Optional[int]]]:
+    """
+    Open the video pages of several advertisers in one browser context and
+    count their videos, sharing the context's connections and cache.
+    Successful results are recorded with record_video_count.
+    """
+    # Bound how many ad-hoc contexts are open at once
+    async with _BROWSER_SEM:
+        context = None
         try:
-            # Use a less strict waiting condition to avoid timeouts
-            await page.goto(video_url, wait_until="domcontentloaded", timeout=45000)
-            await page.screenshot(path=f"screenshots/{advertiser_id}_video_page.png")
+            # Create a context on the shared browser with a realistic viewport
+            browser = await get_browser()
+            context = await browser.new_context(
+                viewport={"width": 1280, "height": 720},
+                user_agent=USER_AGENT
+            )
             
-            # Wait for the page to load
-            await page.wait_for_load_state("domcontentloaded")
+            # Set longer default timeout (60 seconds)
+            context.set_default_timeout(60000)
             
-            # Check if there are videos by looking for video elements or containers
-            video_count = await page.evaluate('''() => {
-                // Check for various video indicators
-                const selectors = [
-                    'video',                           // Direct video elements
-                    'iframe[src*="youtube"]',          // YouTube embeds
-                    'iframe[src*="vimeo"]',            // Vimeo embeds 
-                    'div[role="region"][aria-label*="carousel"]', // Carousels that might contain videos
-                    '.video-container',                // Common video container class
-                    'div[class*="video"]',             // Elements with "video" in class name
-                    'div[id*="video"]',                // Elements with "video" in id
-                    'div[class*="carousel"]',          // Carousel elements that might contain videos
-                    'div[class*="slider"]'             // Slider elements that might contain videos
-                ];
-                
-                // Try each selector
-                for (const selector of selectors) {
-                    const elements = document.querySelectorAll(selector);
-                    if (elements && elements.length > 0) {
-                        return elements.length;
-                    }
-                }
-                
-                // Check for text indicating no videos
-                const noVideoTexts = [
-                    'no video ads',
-                    'no videos',
-                    'no ads found',
-                    'no results',
-                    'no ads to show'
-                ];
-                
-                const pageText = document.body.innerText.toLowerCase();
-                for (const text of noVideoTexts) {
-                    if (pageText.includes(text)) {
-                        return 0;
-                    }
-                }
-                
-                // If we can't determine for sure, look for any ad elements
-                const adElements = document.querySelectorAll('div[class*="ad"], div[id*="ad"], div[aria-label*="ad"]');
-                return adElements.length > 0 ? adElements.length : 0;
-            }''')
+            # Video counts only depend on the DOM, so skip heavy downloads
+            await context.route("**/*", block_heavy_resources)
             
-            has_videos = video_count > 0
-            logging.info(f"Advertiser {advertiser_id} has_videos: {has_videos}, video_count: {video_count}")
+            # Bound the tabs open at once, however large the batch
+            tabs = asyncio.Semaphore(MAX_VIDEO_TABS)
             
-            # Take one more screenshot for verification
-            await page.screenshot(path=f"screenshots/{advertiser_id}_video_detection.png")
+            async def count_in_tab(advertiser_id: str):
+                async with tabs:
+                    return await count_advertiser_videos(context, advertiser_id)
             
-            return has_videos, video_count
+            return await asyncio.gather(*[
+                count_in_tab(advertiser_id) for advertiser_id in advertiser_ids
+            ])
         except Exception as e:
             logging.error(f"Error checking for videos: {str(e)}")
-            import traceback
             logging.error(traceback.format_exc())
-            return False, None
+            return [(False, None)] * len(advertiser_ids)
+        finally:
+            if context:
+                await context.close()
+
+
+async def count_advertiser_videos(
+    context: BrowserContext, advertiser_id: str
+) -> tuple[bool, Optional[int]]:
+    """
+    Count the videos on one advertiser's video page in its own tab.
+    """
+    page = await context.new_page()
+    
+    # Navigate to the video page for this advertiser
+    video_url = f"https://adstransparency.google.com/advertiser/{advertiser_id}?region=US&format=VIDEO"
+    logging.info(f"Navigating to video page: {video_url}")
+    
+    try:
+        # Let the DOM finish parsing before counting, so a lone shell
+        # element is not counted before the results render; heavy resources
+        # are blocked on the context, so this stays fast
+        await page.goto(video_url, wait_until="domcontentloaded", timeout=45000)
+        if DEBUG_SCREENSHOTS:
+            # JPEG of the viewport encodes far faster than a full-page PNG
+            await page.screenshot(
+                path=f"screenshots/{advertiser_id}_video_page.jpg",
+                type="jpeg", quality=60, full_page=False
+            )
+        
+        # Wait briefly for any video indicator or an empty-state container
+        try:
+            match = await page.wait_for_selector(
+                ", ".join(_VIDEO_SELECTORS + [_EMPTY_STATE_SELECTOR]),
+                state="attached",
+                timeout=VIDEO_SELECTOR_TIMEOUT
+            )
+        except TimeoutError:
+            # Neither showed up; "no videos" text still settles it
+            if await page.evaluate(_NO_VIDEOS_TEXT_JS):
+                logging.info(f"Advertiser {advertiser_id} page says it has no videos")
+                await record_video_count(advertiser_id, 0)
+                return False, 0
+            
+            # Otherwise it may just be a slow page, so report no videos
+            # without recording the count
+            logging.info(f"No video indicators for {advertiser_id} within {VIDEO_SELECTOR_TIMEOUT}ms")
+            return False, 0
+        
+        if await match.evaluate("(el, selector) => el.matches(selector)", _EMPTY_STATE_SELECTOR):
+            logging.info(f"Advertiser {advertiser_id} page shows an empty state")
+            await record_video_count(advertiser_id, 0)
+            return False, 0
+        
+        # Check if there are videos by looking for video elements or containers
+        video_count, settled = await count_videos_when_settled(page)
+        
+        has_videos = video_count > 0
+        logging.info(f"Advertiser {advertiser_id} has_videos: {has_videos}, video_count: {video_count}")
+        
+        # Take one more screenshot for verification
+        if DEBUG_SCREENSHOTS:
+            await page.screenshot(
+                path=f"screenshots/{advertiser_id}_video_detection.jpg",
+                type="jpeg", quality=60, full_page=False
+            )
+        
+        # A count that was still changing may be a partial render
+        if settled:
+            await record_video_count(advertiser_id, video_count)
+        else:
+            logging.info(f"Video count for {advertiser_id} did not settle; not recording it")
+        return has_videos, video_count
     except Exception as e:
         logging.error(f"Error checking for videos: {str(e)}")
-        import traceback
         logging.error(traceback.format_exc())
         return False, None
     finally:
-        if browser:
-            await browser.close()
+        await page.close()
+
+
+async def count_videos_when_settled(page) -> tuple[int, bool]:
+    """
+    Count the videos on a page until two counts VIDEO_SETTLE_INTERVAL apart
+    agree, since the results grid keeps rendering after the first video
+    indicator appears. Gives up after VIDEO_SELECTOR_TIMEOUT.
+    
+    Returns:
+        Tuple of (last video count, whether it settled)
+    """
+    video_count = await page.evaluate(_VIDEO_COUNT_JS, _VIDEO_SELECTORS)
+    deadline = time.monotonic() + VIDEO_SELECTOR_TIMEOUT / 1000
+    while time.monotonic() < deadline:
+        await page.wait_for_timeout(VIDEO_SETTLE_INTERVAL)
+        previous = video_count
+        video_count = await page.evaluate(_VIDEO_COUNT_JS, _VIDEO_SELECTORS)
+        if video_count == previous:
+            return video_count, True
+    return video_count, False
+
+
+class VideoCheckBatcher:
+    """
+    Collects video checks requested within a short window and runs them
+    together through scrape_advertiser_videos, so concurrent /scrape calls
+    share one browser context instead of opening one each.
+    """
+
+    def __init__(self, window: float):
+        self.window = window
+        self._pending: Dict[str, asyncio.Future] = {}
+        self._tasks: Set[asyncio.Task] = set()
+
+    async def check(self, advertiser_id: str) -> tuple[bool, Optional[int]]:
+        """Queue a video check and wait for the batch it lands in."""
+        loop = asyncio.get_running_loop()
+        future = self._pending.get(advertiser_id)
+        if future is None:
+            # The first check of a batch schedules the flush
+            if not self._pending:
+                loop.call_later(self.window, self._flush)
+            future = loop.create_future()
+            self._pending[advertiser_id] = future
+        return await future
+
+    def _flush(self):
+        pending, self._pending = self._pending, {}
+        
+        # Hold a reference so the running batch cannot be garbage-collected
+        task = asyncio.create_task(self._run(pending))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, pending: Dict[str, asyncio.Future]):
+        advertiser_ids = list(pending)
+        logging.info(f"Checking videos for a batch of {len(advertiser_ids)} advertisers")
+        try:
+            results = await scrape_advertiser_videos(advertiser_ids)
+            for advertiser_id, result in zip(advertiser_ids, results):
+                future = pending[advertiser_id]
+                if not future.done():
+                    future.set_result(result)
+        except asyncio.CancelledError:
+            for future in pending.values():
+                future.cancel()
+            raise
+        except Exception as e:
+            logging.error(f"Error checking videos for a batch: {str(e)}")
+            logging.error(traceback.format_exc())
+            
+            # Fail every waiter instead of leaving joined callers hanging
+            for future in pending.values():
+                if not future.done():
+                    future.set_exception(e)
+
+
+_video_batcher = VideoCheckBatcher(VIDEO_BATCH_WINDOW)
 
 
 if __name__ == "__main__":
@@ -8,7 +8,6 @@ This script:
 
 import os
 import sys
-import subprocess
 from install_browsers import install_browsers
 
 # Load environment variables from .env file
@@ -26,9 +25,12 @@ def check_requirements():
         # We're only importing these to check if they're installed
         # pylint: disable=unused-import,import-outside-toplevel
         import fastapi
+        import uvicorn
         import playwright
         import requests
-        import bs4
+        import httpx
+        import selectolax
+        import cachetools
         import pytesseract
         import PIL
         return True
@@ -43,20 +45,21 @@ def start_server():
     # Get configuration from environment or use defaults
     host = os.environ.get("HOST", "0.0.0.0")
     port = int(os.environ.get("PORT", "9001"))
+    reload = os.environ.get("RELOAD") == "1"
+    workers = int(os.environ.get("WORKERS", "1"))
     
     print(f"🚀 Starting FastAPI server on http://{host}:{port}")
     print("Press CTRL+C to stop the server")
     
-    # Start uvicorn server
-    subprocess.run(
-        [
-            "uvicorn", 
-            "main:app", 
-            "--host", host, 
-            "--port", str(port),
-            "--reload"
-        ],
-        check=True
+    # Start uvicorn in this process instead of spawning the CLI
+    # pylint: disable=import-outside-toplevel
+    import uvicorn
+    uvicorn.run(
+        "main:app",
+        host=host,
+        port=port,
+        reload=reload,
+        workers=workers
     )
 
 
@@ -1,37 +1,57 @@
-import requests
+import asyncio
 import json
-import time
+
+import httpx
 
 # The advertiser ID that we know has 34 videos
 target_id = "AR14017378248766259201"
 
-# Wait for the server to start
-time.sleep(2)
-
 # Test with different advertiser names
 advertisers = ["Google", "YouTube", "AR14017378248766259201"]
 
-for advertiser_name in advertisers:
+
+def report(advertiser_name, response):
     print(f"\nTesting with advertiser: {advertiser_name}")
-    
-    try:
-        response = requests.post(
-            "http://localhost:8000/scrape",
-            json={"advertiser_name": advertiser_name},
-            timeout=120  # Longer timeout for the scraping process
-        )
-        print(f"Response status: {response.status_code}")
-        
-        if response.status_code == 200:
-            data = response.json()
-            print(json.dumps(data, indent=2))
-            
-            # Check if this has videos
-            if data.get("has_videos"):
-                print(f"✅ {advertiser_name} has {data.get('video_count')} videos!")
-            else:
-                print(f"❌ {advertiser_name} has no videos")
+
+    if isinstance(response, Exception):
+        print(f"Exception occurred: {str(response)}")
+        return
+
+    print(f"Response status: {response.status_code}")
+
+    if response.status_code == 200:
+        data = response.json()
+        print(json.dumps(data, indent=2))
+
+        # Check if this has videos
+        if data.get("has_videos"):
+            print(f"✅ {advertiser_name} has {data.get('video_count')} videos!")
         else:
-            print(f"Error: {response.text}")
-    except Exception as e:
-        print(f"Exception occurred: {str(e)}") 
\ No newline at end of file
+            print(f"❌ {advertiser_name} has no videos")
+    else:
+        print(f"Error: {response.text}")
+
+
+async def main():
+    # Wait for the server to start
+    await asyncio.sleep(2)
+
+    # One pooled client for all requests, which run in parallel
+    async with httpx.AsyncClient(timeout=120) as client:  # Longer timeout for the scraping process
+        responses = await asyncio.gather(
+            *[
+                client.post(
+                    "http://localhost:8000/scrape",
+                    json={"advertiser_name": advertiser_name}
+                )
+                for advertiser_name in advertisers
+            ],
+            return_exceptions=True
+        )
+
+    for advertiser_name, response in zip(advertisers, responses):
+        report(advertiser_name, response)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
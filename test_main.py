@@ -1,11 +1,30 @@
 """
 Tests for the Google Ads Transparency Scraper API.
 """
+import asyncio
+import json
+import os
+import tempfile
+import time
 import unittest
-from unittest.mock import patch
+from unittest.mock import AsyncMock, patch
 from fastapi.testclient import TestClient
+from selectolax.lexbor import LexborHTMLParser
 
-from main import app
+from main import (
+    app,
+    MAX_BATCH_SIZE,
+    AdvertiserRequest,
+    OCRCache,
+    VideoCheckBatcher,
+    count_videos_when_settled,
+    extract_advertiser_id_from_url,
+    lookup_known_video_count,
+    save_known_video_count,
+    scrape_advertiser_endpoint,
+    scrape_advertiser_page,
+)
+from _cleanup import clean_ocr_text
 
 
 class TestScraper(unittest.TestCase):
@@ -15,20 +34,13 @@ class TestScraper(unittest.TestCase):
         """Set up the test client."""
         self.client = TestClient(app)
 
-    @patch("main.get_advertiser_id")
-    @patch("main.scrape_advertiser_page")
-    @patch("main.extract_text_from_images")
-    async def test_scrape_success(
-        self, mock_extract_text, mock_scrape_page, mock_get_id
-    ):
+    @patch("main.check_advertiser_videos", new_callable=AsyncMock)
+    @patch("main.get_advertiser_id", new_callable=AsyncMock)
+    def test_scrape_success(self, mock_get_id, mock_check_videos):
         """Test the scrape endpoint with a successful response."""
         # Mock the responses
         mock_get_id.return_value = "AR12345678901234567890"
-        mock_scrape_page.return_value = (
-            ["html", "body", "div"], 
-            ["http://example.com/image.jpg"]
-        )
-        mock_extract_text.return_value = ["example text from image"]
+        mock_check_videos.return_value = (True, 3)
 
         # Make the request
         response = self.client.post(
@@ -39,12 +51,15 @@ class TestScraper(unittest.TestCase):
         # Assert the response
         self.assertEqual(response.status_code, 200)
         data = response.json()
-        self.assertEqual(data["advertiser_id"], "AR12345678901234567890")
-        self.assertEqual(data["tags"], ["html", "body", "div"])
-        self.assertEqual(data["image_text"], ["example text from image"])
+        self.assertEqual(
+            data["advertiser_google_id"], "AR12345678901234567890"
+        )
+        self.assertTrue(data["has_videos"])
+        self.assertEqual(data["video_count"], 3)
+        mock_check_videos.assert_awaited_once_with("AR12345678901234567890")
 
-    @patch("main.get_advertiser_id")
-    async def test_advertiser_not_found(self, mock_get_id):
+    @patch("main.get_advertiser_id", new_callable=AsyncMock)
+    def test_advertiser_not_found(self, mock_get_id):
         """Test the scrape endpoint when advertiser is not found."""
         # Mock the response
         mock_get_id.return_value = None
@@ -57,7 +72,7 @@ class TestScraper(unittest.TestCase):
 
         # Assert the response
         self.assertEqual(response.status_code, 404)
-        self.assertIn("No advertiser found", response.json()["detail"])
+        self.assertIn("No advertiser ID found", response.json()["detail"])
 
     def test_empty_advertiser_name(self):
         """Test the scrape endpoint with an empty advertiser name."""
@@ -71,6 +86,192 @@ class TestScraper(unittest.TestCase):
         self.assertEqual(response.status_code, 400)
         self.assertIn("empty", response.json()["detail"])
 
+    @patch("main.check_advertiser_videos", new_callable=AsyncMock)
+    @patch("main.get_advertiser_id", new_callable=AsyncMock)
+    def test_concurrent_scrapes_share_work(
+        self, mock_get_id, mock_check_videos
+    ):
+        """Test that concurrent scrapes of one advertiser run only once."""
+        mock_get_id.return_value = "AR12345678901234567890"
+        mock_check_videos.return_value = (True, 3)
+
+        async def scrape_twice():
+            return await asyncio.gather(
+                scrape_advertiser_endpoint(
+                    AdvertiserRequest(advertiser_name="nike")
+                ),
+                scrape_advertiser_endpoint(
+                    AdvertiserRequest(advertiser_name="Nike")
+                ),
+            )
+
+        first, second = asyncio.run(scrape_twice())
+
+        self.assertEqual(first, second)
+        self.assertEqual(first.video_count, 3)
+        mock_get_id.assert_awaited_once_with("nike")
+
+    @patch("main.scrape_advertiser_videos", new_callable=AsyncMock)
+    def test_video_checks_are_batched(self, mock_scrape_videos):
+        """Test that video checks in one window share one browser pass."""
+        mock_scrape_videos.return_value = [(True, 2), (False, 0)]
+        batcher = VideoCheckBatcher(0.01)
+
+        async def check_both():
+            return await asyncio.gather(
+                batcher.check("AR1"), batcher.check("AR2")
+            )
+
+        results = asyncio.run(check_both())
+
+        self.assertEqual(results, [(True, 2), (False, 0)])
+        mock_scrape_videos.assert_awaited_once_with(["AR1", "AR2"])
+
+    def test_video_count_waits_to_settle(self):
+        """Test that video counts are only settled once two reads agree."""
+        page = AsyncMock()
+        page.evaluate.side_effect = [3, 8, 8]
+
+        self.assertEqual(asyncio.run(count_videos_when_settled(page)), (8, True))
+
+        page.evaluate.side_effect = iter(range(1000))
+        with patch("main.VIDEO_SELECTOR_TIMEOUT", 0):
+            self.assertEqual(
+                asyncio.run(count_videos_when_settled(page)), (0, False)
+            )
+
+    @patch("main.check_advertiser_videos_batch", new_callable=AsyncMock)
+    @patch("main.get_advertiser_id", new_callable=AsyncMock)
+    def test_scrape_batch(self, mock_get_id, mock_check_batch):
+        """Test the batch endpoint, including a name with no advertiser."""
+        ids = {"nike": "AR1", "puma": "AR2"}
+        mock_get_id.side_effect = lambda name: ids.get(name)
+        mock_check_batch.return_value = [(True, 3), (False, 0)]
+
+        response = self.client.post(
+            "/scrape_batch",
+            json={"advertiser_names": ["nike", "unknown", "puma"]}
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), [
+            {"advertiser_google_id": "AR1", "has_videos": True, "video_count": 3},
+            {"advertiser_google_id": None, "has_videos": None, "video_count": None},
+            {"advertiser_google_id": "AR2", "has_videos": False, "video_count": 0},
+        ])
+        mock_check_batch.assert_awaited_once_with(["AR1", "AR2"])
+
+    def test_scrape_batch_too_large(self):
+        """Test that the batch endpoint rejects oversized batches."""
+        response = self.client.post(
+            "/scrape_batch",
+            json={"advertiser_names": ["nike"] * (MAX_BATCH_SIZE + 1)}
+        )
+
+        self.assertEqual(response.status_code, 422)
+
+    @patch("main.scrape_advertiser_videos", new_callable=AsyncMock)
+    def test_failed_video_batch_fails_waiters(self, mock_scrape_videos):
+        """Test that a failing batch raises in every waiting check."""
+        mock_scrape_videos.side_effect = RuntimeError("browser crashed")
+        batcher = VideoCheckBatcher(0.01)
+
+        async def check_both():
+            return await asyncio.gather(
+                batcher.check("AR1"), batcher.check("AR2"),
+                return_exceptions=True
+            )
+
+        results = asyncio.run(check_both())
+
+        self.assertTrue(all(isinstance(r, RuntimeError) for r in results))
+
+    def test_ocr_cache_evicts_least_used(self):
+        """Test that the OCR cache evicts the least used entry first."""
+        a, b, c = (f"https://example.com/{name}.png" for name in "abc")
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = OCRCache(os.path.join(tmp, "ocr.sqlite3"), size_limit=10)
+            cache.set_many({a: "hello", b: "world"})
+            self.assertEqual(cache.get_many([a]), {a: "hello"})
+
+            cache.set_many({c: "again"})
+
+            self.assertEqual(
+                cache.get_many([a, b, c]), {a: "hello", c: "again"}
+            )
+            cache.close()
+
+    def test_ocr_cache_errors_are_misses(self):
+        """Test that database errors turn into cache misses."""
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = OCRCache(os.path.join(tmp, "ocr.sqlite3"), size_limit=10)
+            cache.close()
+
+            cache.set_many({"https://example.com/a.png": "hello"})
+            self.assertEqual(cache.get_many(["https://example.com/a.png"]), {})
+
+    @patch("main._checked_video_counts", {})
+    def test_saved_video_counts_merge_and_expire(self):
+        """Test that saves keep other workers' live entries and drop expired ones."""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "counts.json")
+            with open(path, "w") as f:
+                json.dump({
+                    "AR1": {"video_count": 2, "checked_at": 0},
+                    "AR3": {"video_count": 1, "checked_at": time.time()},
+                }, f)
+
+            with patch("main.KNOWN_VIDEO_COUNTS_FILE", path):
+                save_known_video_count("AR2", 5)
+
+            with open(path) as f:
+                self.assertEqual(set(json.load(f)), {"AR2", "AR3"})
+            self.assertEqual(lookup_known_video_count("AR2"), (True, 5))
+            self.assertEqual(lookup_known_video_count("AR3"), (True, 1))
+            self.assertIsNone(lookup_known_video_count("AR1"))
+
+    @patch("main.extract_text_from_images", new_callable=AsyncMock)
+    @patch("main.fetch_advertiser_page", new_callable=AsyncMock)
+    def test_scrape_advertiser_page(self, mock_fetch_page, mock_extract_text):
+        """Test that page scraping OCRs the page's images alongside tags."""
+        base_url = "https://adstransparency.google.com/advertiser/AR1"
+        mock_fetch_page.return_value = (base_url, LexborHTMLParser(
+            '<html><body><div><img src="/ad.png"></div></body></html>'
+        ))
+        mock_extract_text.return_value = ["example text from image"]
+
+        tags, image_text = asyncio.run(scrape_advertiser_page("AR1"))
+
+        self.assertEqual(set(tags), {"html", "head", "body", "div", "img"})
+        self.assertEqual(image_text, ["example text from image"])
+        mock_extract_text.assert_awaited_once_with(
+            ["https://adstransparency.google.com/ad.png"]
+        )
+
+    def test_clean_ocr_text(self):
+        """Test OCR text normalization for ASCII and non-ASCII input."""
+        cases = {
+            "  Just DO it!\n\nNike,  Inc. ": "just do it nike inc",
+            "Café — Ünïcode™": "café ünïcode",
+            "!!! ...": "",
+        }
+        for raw, expected in cases.items():
+            with self.subTest(raw=raw):
+                self.assertEqual(clean_ocr_text(raw), expected)
+
+    def test_extract_advertiser_id_from_url(self):
+        """Test advertiser ID extraction from the supported URL shapes."""
+        cases = {
+            "https://adstransparency.google.com/advertiser/"
+            "AR14017378248766259201?region=US": "AR14017378248766259201",
+            "https://adstransparency.google.com/?q=AR123": "AR123",
+            "https://adstransparency.google.com/?region=US&id=XYZ789": "XYZ789",
+            "https://adstransparency.google.com/?region=US": None,
+        }
+        for url, expected in cases.items():
+            with self.subTest(url=url):
+                self.assertEqual(extract_advertiser_id_from_url(url), expected)
+
 
 if __name__ == "__main__":
     unittest.main() 
\ No newline at end of file